@@ -3,14 +3,42 @@ the corresponding Kubernetes API models.
 """
 
 import builtins
+import functools
 import os
 import re
-from typing import Any, Dict, List, Union
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple, Union)
 
 import kubernetes
 import yaml
 from kubernetes.client import models
 
+# Prefer the libyaml backed loader, which is much faster than the pure
+# Python implementation, when it is available.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Manifests which are plain JSON (e.g. kubectl output) can be parsed much
+# faster with a JSON parser. Prefer orjson when it is installed.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Matches content whose first non-whitespace byte opens a JSON object or array.
+_JSON_START = re.compile(rb'\s*[\[{]')
+
+# A reference to the kubernetes client model locals. The models module does
+# not change after import, so there is no need to look it up repeatedly.
+_MODELS_DICT = models.__dict__
+
+# A map of the kubernetes client model locals where the key is the lower cased
+# name and the value is the correctly cased name. This is lazily populated on
+# first use by _models_lower().
+_MODELS_LOWER: Optional[Dict[str, str]] = None
+
 
 def load_file(path: str) -> List[object]:
     """Load an individual Kubernetes manifest YAML file.
@@ -24,19 +52,41 @@ def load_file(path: str) -> List[object]:
     Returns:
         A list of the Kubernetes API objects for this manifest file.
     """
-    with open(path, 'r') as f:
-        manifests = yaml.load_all(f, Loader=yaml.SafeLoader)
-
-        objs = []
-        for manifest in manifests:
-            obj_type = get_type(manifest)
-            if obj_type is None:
-                raise ValueError(
-                    f'Unable to determine object type for manifest: {manifest}',
-                )
-            objs.append(new_object(obj_type, manifest))
+    return list(iter_load_file(path))
 
-    return objs
+
+def iter_load_file(path: str) -> Iterator[object]:
+    """Iterate over the objects in an individual Kubernetes manifest YAML file.
+
+    This is the streaming counterpart to load_file. Objects are yielded one
+    at a time, so callers do not need to hold the whole list. For multi-document
+    YAML, each document is parsed and converted in turn, so only one parsed
+    document is held at once. The raw file content is held for the whole
+    iteration, and JSON content is parsed as one document up front.
+
+    Args:
+        path: The fully qualified path to the file.
+
+    Yields:
+        The Kubernetes API objects for this manifest file, in file order.
+    """
+    # Read the whole file up front so the YAML parser can scan the content
+    # from memory rather than reading it through the text IO layer.
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    for manifest in _load_all(data):
+        obj_type = get_type(manifest)
+        if obj_type is None:
+            raise ValueError(
+                f'Unable to determine object type for manifest: {manifest}',
+            )
+        obj = new_object(obj_type, manifest)
+
+        # Release the parsed document before handing off the object so it
+        # can be reclaimed while the caller processes the object.
+        del manifest
+        yield obj
 
 
 def load_path(path: str) -> List[object]:
@@ -55,10 +105,15 @@ def load_path(path: str) -> List[object]:
     if not os.path.isdir(path):
         raise ValueError(f'{path} is not a directory')
 
+    with os.scandir(path) as entries:
+        paths = [
+            e.path for e in entries
+            if e.name.lower().endswith(('.yaml', '.yml')) and e.is_file()
+        ]
+
     objs = []
-    for f in os.listdir(path):
-        if os.path.splitext(f)[1].lower() in ['.yaml', '.yml']:
-            objs = objs + load_file(os.path.join(path, f))
+    for p in paths:
+        objs.extend(load_file(p))
     return objs
 
 
@@ -89,10 +144,28 @@ def get_type(manifest: Dict[str, Any]) -> Union[object, None]:
     if kind is None:
         raise ValueError('manifest has no "kind" field specified')
 
-    # create a map of the kubernetes client model locals where the key is the
+    return _resolve_type(version, kind)
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_type(version: str, kind: str) -> Union[object, None]:
+    """Resolve the Kubernetes object type for the given version and kind.
+
+    Manifests generally only use a small number of distinct version/kind
+    pairs, so the results are cached to make repeated lookups cheap.
+
+    Args:
+        version: The manifest apiVersion (e.g. apps/v1).
+        kind: The manifest kind (e.g. Deployment).
+
+    Returns:
+        The Kubernetes API object for the version and kind. If no Kubernetes
+        API object type can be determined, None is returned.
+    """
+    # get the map of the kubernetes client model locals where the key is the
     # lower cased name (so we don't have to mess with getting the capitalization
     # of components correct) and the value is the correctly cased name.
-    lookup = {k.lower(): k for k in models.__dict__.keys()}
+    lookup = _models_lower()
 
     # if the version has a '/' (e.g. apps/v1, extensions/v1beta1), remove it.
 
@@ -114,10 +187,25 @@ def get_type(manifest: Dict[str, Any]) -> Union[object, None]:
         type_name = lookup.get(to_check.lower())
         if type_name is None:
             continue
-        return models.__dict__.get(type_name)
+        return _MODELS_DICT.get(type_name)
     return None
 
 
+def _models_lower() -> Dict[str, str]:
+    """Get the lookup map of lower cased kubernetes client model names to
+    their correctly cased names.
+
+    The map is built on first call and cached for all subsequent calls.
+
+    Returns:
+        The lower cased model name lookup map.
+    """
+    global _MODELS_LOWER
+    if _MODELS_LOWER is None:
+        _MODELS_LOWER = {k.lower(): k for k in _MODELS_DICT}
+    return _MODELS_LOWER
+
+
 def load_type(obj_type, path: str):
     """Load a Kubernetes YAML manifest file for the specified type.
 
@@ -137,12 +225,59 @@ def load_type(obj_type, path: str):
     Raises:
         FileNotFoundError: The specified file was not found.
     """
-    with open(path, 'r') as f:
-        manifest = yaml.full_load(f)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    manifest = _load(data)
 
     return new_object(obj_type, manifest)
 
 
+def _load(data: bytes) -> Any:
+    """Load a single manifest document from the raw file content.
+
+    JSON content is parsed with the JSON parser, falling back to the YAML
+    parser if it is not valid JSON.
+
+    Args:
+        data: The raw manifest file content.
+
+    Returns:
+        The loaded manifest document.
+    """
+    if _is_json(data):
+        try:
+            return _json.loads(data)
+        except ValueError:
+            pass
+    return yaml.load(data, Loader=_SafeLoader)
+
+
+def _load_all(data: bytes) -> Iterable[Any]:
+    """Load all of the manifest documents from the raw file content.
+
+    JSON content is parsed with the JSON parser, falling back to the YAML
+    parser if it is not valid JSON (e.g. multiple '---' separated documents).
+
+    Args:
+        data: The raw manifest file content.
+
+    Returns:
+        An iterable of the loaded manifest documents.
+    """
+    if _is_json(data):
+        try:
+            return [_json.loads(data)]
+        except ValueError:
+            pass
+    return yaml.load_all(data, Loader=_SafeLoader)
+
+
+def _is_json(data: bytes) -> bool:
+    """Check whether the raw file content looks like a JSON document."""
+    return _JSON_START.match(data) is not None
+
+
 def new_object(root_type, config):
     """Create a new Kubernetes API object and recursively populate it with
     the provided manifest configuration.
@@ -165,64 +300,215 @@ def new_object(root_type, config):
     Returns:
         A Kubernetes API object recursively populated with the YAML contents.
     """
+    return _builder_for(root_type)(config)
 
-    # The arguments that will be passed to the root_type to create a new
-    # recursively populated instance of that type.
-    constructor_args = {}
 
-    # The attribute map maps the argument name (e.g. api_version) to the name
-    # of the corresponding configuration field (e.g. apiVersion). Iterate over
-    # each of these to pick up all the possible configuration options from the
-    # provided manifest.
-    for k, v in root_type.attribute_map.items():
-        cfg_value = config.get(v)
-        if cfg_value is not None:
-
-            # The config value matches an expected key in the attribute dict.
-            # Now, we want to cast that config to the appropriate type based
-            # on the contents of the 'swagger_types'/'openapi_types' dict.
-            if hasattr(root_type, 'swagger_types'):
-                t = root_type.swagger_types[k]
-            else:
-                t = root_type.openapi_types[k]
-
-            # There are two classes of types we will want to check against:
-            # 'base types' (like: str, int, etc) and 'collection types'
-            # (like: list, dict). Collection types can contain base types,
-            # so we will want to apply the same base type checks to each
-            # element within a collection type. First we will check for the
-            # collection types. If it is neither, we assume that the type is
-            # a base type.
-
-            # Check if the type is a list of some other type.
-            # This should match to something like: 'list[str]', where the
-            # element type (in this case 'str') will be isolated as a group.
-            list_match = re.match(r'^list\[(.*)\]$', t)
-            if list_match is not None:
-                element_type = list_match.group(1)
-                list_value = [cast_value(i, element_type) for i in cfg_value]
-                constructor_args[k] = list_value
-                continue
+@functools.lru_cache(maxsize=None)
+def _builder_for(root_type) -> Callable[[Dict[str, Any]], Any]:
+    """Get a function which builds an instance of the given Kubernetes API
+    object type from its manifest configuration.
+
+    The function is specialized for the type from its attribute schema: the
+    conversion for each field (list, dict, or base type cast) is decided once
+    here rather than for every object that gets built.
+
+    Args:
+        root_type: The Kubernetes API object type to get the builder for.
 
-            # Check if the type is a dict composed of other types.
-            # This should match to something lint: 'dict(str, str)', where
-            # the element types (in this case, both 'str') will be isolated
-            # as separate groups.
-            dict_match = re.match(r'^dict\((.*), (.*)\)$', t)
-            if dict_match is not None:
-                key_type = dict_match.group(1)
-                val_type = dict_match.group(2)
-                dict_value = {
-                    cast_value(k, key_type): cast_value(v, val_type)
-                    for k, v in cfg_value.items()
-                }
-                constructor_args[k] = dict_value
+    Returns:
+        A function which takes the manifest configuration for the API object
+        and returns a recursively populated instance of the type.
+    """
+    # Map each configuration field name (e.g. apiVersion) to the argument
+    # name (e.g. api_version) and the conversion for its value. Manifests
+    # typically set only a few of a type's fields, so building an object
+    # walks the provided config rather than every field in the schema.
+    fields = {}
+    for k, v, collection, resolver, val_resolver in _schema_for(root_type):
+        # The type is a list of some other type, e.g. 'list[str]'.
+        if collection == 'list':
+            fields[v] = (k, _list_converter(resolver))
+
+        # The type is a dict composed of other types, e.g. 'dict(str, str)'.
+        elif collection == 'dict':
+            fields[v] = (k, _dict_converter(resolver, val_resolver))
+
+        # If it is not a collection type, it must be a base type.
+        else:
+            fields[v] = (k, resolver)
+
+    def build(config: Dict[str, Any]) -> Any:
+        # The arguments that will be passed to the root_type to create a new
+        # recursively populated instance of that type.
+        constructor_args = {}
+
+        get_field = fields.get
+        for v, cfg_value in config.items():
+            field = get_field(v)
+            if field is None or cfg_value is None:
                 continue
+            k, convert = field
+            constructor_args[k] = convert(cfg_value)
+
+        return root_type(**constructor_args)
+    return build
+
+
+def _list_converter(resolver: Callable[[Any], Any]) -> Callable[[Any], List[Any]]:
+    """Get a function which casts each element of a list config value."""
+    def convert(value: Any) -> List[Any]:
+        return [resolver(i) for i in value]
+    return convert
+
+
+def _dict_converter(
+        key_resolver: Callable[[Any], Any],
+        val_resolver: Callable[[Any], Any],
+) -> Callable[[Any], Dict[Any, Any]]:
+    """Get a function which casts each key and value of a dict config value."""
+    def convert(value: Any) -> Dict[Any, Any]:
+        return {key_resolver(k): val_resolver(v) for k, v in value.items()}
+    return convert
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_for(root_type) -> Tuple[Tuple[str, str, str, Callable, Optional[Callable]], ...]:
+    """Get the parsed attribute schema for a Kubernetes API object type.
+
+    The schema is derived from the swagger_types/openapi_types and attribute_map
+    members of the type. Since these do not change, the schema is computed once
+    per type and cached.
+
+    Args:
+        root_type: The Kubernetes API object type to get the schema for.
+
+    Returns:
+        A tuple of records, one per attribute, of the form (attr_name, config_key,
+        collection, resolver, val_resolver). The collection is one of 'list', 'dict',
+        or 'base'. For 'list' and 'base' the resolver casts the (element) value and
+        val_resolver is None; for 'dict' the resolver casts the keys and val_resolver
+        casts the values.
+    """
+    if hasattr(root_type, 'swagger_types'):
+        types = root_type.swagger_types
+    else:
+        types = root_type.openapi_types
+
+    # There are two classes of types we will want to check against:
+    # 'base types' (like: str, int, etc) and 'collection types'
+    # (like: list, dict). Collection types can contain base types,
+    # so we will want to apply the same base type checks to each
+    # element within a collection type.
+    schema = []
+    for k, v in root_type.attribute_map.items():
+        parsed = _parse_collection(types[k])
+        if parsed[0] == 'dict':
+            schema.append((
+                k, v, 'dict', _schema_resolver(parsed[1]), _schema_resolver(parsed[2]),
+            ))
+        else:
+            schema.append((k, v, parsed[0], _schema_resolver(parsed[1]), None))
+    return tuple(schema)
 
-            # If it is not a collection type, it must be a base type.
-            constructor_args[k] = cast_value(cfg_value, t)
 
-    return root_type(**constructor_args)
+def _schema_resolver(t: str) -> Callable[[Any], Any]:
+    """Get the resolver for a type referenced by an attribute schema.
+
+    Not every type referenced by the Kubernetes client has a cast behavior
+    (e.g. 'datetime'). Rather than failing when the schema is built, the
+    returned resolver for those types fails only if it is actually used.
+
+    Args:
+        t: The type string to get the resolver for.
+
+    Returns:
+        A callable which casts a value to the specified type.
+    """
+    try:
+        return _resolver_for(t)
+    except ValueError:
+        return functools.partial(cast_value, t=t)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolver_for(t: str) -> Callable[[Any], Any]:
+    """Get a callable which casts a value to the specified type.
+
+    Resolving the type is invariant for a given type string, so the
+    resulting callable is cached.
+
+    Args:
+        t: The type to cast values to. This can be a builtin type or a
+            Kubernetes API object type.
+
+    Returns:
+        A callable which takes a value and returns it cast to the type.
+
+    Raises:
+        ValueError: Unable to determine the cast behavior for the type.
+    """
+    # The config value should be cast to a built-in type
+    builtin_type = builtins.__dict__.get(t)
+    if builtin_type == object:
+        return _passthrough
+    if builtin_type is not None:
+        return _builtin_caster(builtin_type)
+
+    # The config value should be cast to a Kubernetes type
+    k_type = kubernetes.client.__dict__.get(t)
+    if k_type is not None:
+        return functools.partial(new_object, k_type)
+
+    raise ValueError(f'Unable to determine cast type behavior: {t}')
+
+
+def _builtin_caster(builtin_type: type) -> Callable[[Any], Any]:
+    """Get a callable which casts a value to the given builtin type.
+
+    Values loaded from YAML are usually already of the expected type, in
+    which case they are returned as-is without calling the type.
+
+    Args:
+        builtin_type: The builtin type to cast values to.
+
+    Returns:
+        A callable which takes a value and returns it cast to the type.
+    """
+    def cast(value: Any) -> Any:
+        if type(value) is builtin_type:
+            return value
+        return builtin_type(value)
+    return cast
+
+
+def _passthrough(value: Any) -> Any:
+    """Return the given value unchanged, for values typed as 'object'."""
+    return value
+
+
+def _parse_collection(t: str) -> Tuple[str, ...]:
+    """Parse a swagger/openapi type string into its collection components.
+
+    The type string grammar is fixed by the generated Kubernetes client, so
+    this uses simple string checks rather than regular expressions.
+
+    Args:
+        t: The type string (e.g. 'list[str]', 'dict(str, str)', 'V1Pod').
+
+    Returns:
+        A tuple whose first element identifies the type class: ('list', elem)
+        for a list type, ('dict', key, val) for a dict type, or ('base', t)
+        for anything else.
+    """
+    if t.startswith('list[') and t.endswith(']'):
+        return 'list', t[5:-1]
+
+    if t.startswith('dict(') and t.endswith(')'):
+        key_type, sep, val_type = t[5:-1].partition(', ')
+        if sep:
+            return 'dict', key_type, val_type
+
+    return 'base', t
 
 
 def cast_value(value: Any, t: str) -> Any:
@@ -248,17 +534,4 @@ def cast_value(value: Any, t: str) -> Any:
         TypeError: Unable to cast the given value to the specified type.
         AttributeError: The value is an invalid Kubernetes type.
     """
-
-    # The config value should be cast to a built-in type
-    builtin_type = builtins.__dict__.get(t)
-    if builtin_type == object:
-        return value
-    if builtin_type is not None:
-        return builtin_type(value)
-
-    # The config value should be cast to a Kubernetes type
-    k_type = kubernetes.client.__dict__.get(t)
-    if k_type is not None:
-        return new_object(k_type, value)
-
-    raise ValueError(f'Unable to determine cast type behavior: {t}')
+    return _resolver_for(t)(value)
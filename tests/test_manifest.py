@@ -49,6 +49,13 @@ class TestCastValue:
         assert type(actual) == type(expected)
         assert actual == expected
 
+    def test_builtin_type_unchanged(self):
+        """Test that a value already of the builtin type is returned as-is."""
+
+        # list() would copy the value, so identity shows the cast was skipped.
+        value = ['a', 'b']
+        assert manifest.cast_value(value, 'list') is value
+
     @pytest.mark.parametrize(
         'value,t,error', [
             # builtin types
@@ -73,12 +80,44 @@ class TestCastValue:
             manifest.cast_value(value, t)
 
 
+class TestParseCollection:
+    """Tests for kubetest.manifest._parse_collection"""
+
+    @pytest.mark.parametrize(
+        't,expected', [
+            ('str', ('base', 'str')),
+            ('V1ObjectMeta', ('base', 'V1ObjectMeta')),
+            ('list[str]', ('list', 'str')),
+            ('list[V1Container]', ('list', 'V1Container')),
+            ('dict(str, str)', ('dict', 'str', 'str')),
+            ('dict(str, list[str])', ('dict', 'str', 'list[str]')),
+        ]
+    )
+    def test_ok(self, t, expected):
+        """Test parsing type strings into their collection components."""
+
+        assert manifest._parse_collection(t) == expected
+
+
 class TestNewObject:
     """Tests for kubetest.manifest.new_object"""
 
     # TODO - a lot of this is tested implicitly in TestLoadType. Once we have
     # test coverage set up, can add tests based on whats missing.
 
+    def test_ignores_unknown_and_null_fields(self):
+        """Test that config fields not in the type schema, or with null values,
+        are not passed to the object.
+        """
+
+        obj = manifest.new_object(client.V1ObjectMeta, {
+            'name': 'test',
+            'namespace': None,
+            'notAField': 'foo',
+            'labels': {'app': 'test'},
+        })
+        assert obj == client.V1ObjectMeta(name='test', labels={'app': 'test'})
+
 
 class TestLoadType:
     """Tests for kubetest.manifest.load_type"""
@@ -91,6 +130,23 @@ class TestLoadType:
         )
         assert obj == simple_deployment
 
+    def test_simple_deployment_json_ok(self, manifest_dir, simple_deployment):
+        """Test loading the simple deployment from JSON successfully."""
+        obj = manifest.load_type(
+            client.V1Deployment,
+            os.path.join(manifest_dir, 'simple-deployment.json')
+        )
+        assert obj == simple_deployment
+
+    def test_flow_style_yaml_ok(self, manifest_dir):
+        """Test loading a flow-style YAML manifest which looks like JSON."""
+        obj = manifest.load_type(
+            client.V1ConfigMap,
+            os.path.join(manifest_dir, 'flow-style-configmap.yaml')
+        )
+        assert obj.metadata.name == 'flow-config'
+        assert obj.data == {'key': 'value'}
+
     def test_simple_deployment_wrong_type(self, manifest_dir):
         """Test loading the simple deployment to the wrong type."""
         with pytest.raises(ValueError):
@@ -320,6 +376,19 @@ class TestGetType:
         })
         assert t is None
 
+    def test_cached(self):
+        """Test that getting the same type again is served from the cache."""
+
+        manifest._resolve_type.cache_clear()
+
+        data = {'apiVersion': 'apps/v1', 'kind': 'Deployment'}
+        assert manifest.get_type(data) == client.V1Deployment
+        assert manifest.get_type(dict(data)) == client.V1Deployment
+
+        info = manifest._resolve_type.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
     def test_no_version(self):
         """Test getting a type when no version is given."""
 
@@ -378,6 +447,15 @@ class TestLoadFile:
         assert len(objs) == 1
         assert isinstance(objs[0], client.models.v1_deployment.V1Deployment)
 
+    def test_ok_json(self, manifest_dir, simple_deployment):
+        """Load manifest file with a JSON object definition."""
+
+        objs = manifest.load_file(
+            os.path.join(manifest_dir, 'simple-deployment.json')
+        )
+
+        assert objs == [simple_deployment]
+
     def test_ok_multi(self, manifest_dir):
         """Load manifest file with multiple object definitions."""
 
@@ -390,6 +468,30 @@ class TestLoadFile:
         assert isinstance(objs[1], client.models.v1_service.V1Service)
         assert isinstance(objs[2], client.models.v1_deployment.V1Deployment)
 
+    def test_ok_flow_style_yaml(self, manifest_dir):
+        """Load a flow-style YAML manifest which looks like JSON but is not."""
+
+        objs = manifest.load_file(
+            os.path.join(manifest_dir, 'flow-style-configmap.yaml')
+        )
+
+        assert objs == [client.V1ConfigMap(
+            api_version='v1',
+            kind='ConfigMap',
+            metadata=client.V1ObjectMeta(name='flow-config'),
+            data={'key': 'value'},
+        )]
+
+    def test_ok_multi_json(self, manifest_dir):
+        """Load manifest file with multiple '---' separated JSON documents."""
+
+        objs = manifest.load_file(
+            os.path.join(manifest_dir, 'multi-obj-manifest.json')
+        )
+
+        assert len(objs) == 2
+        assert [o.metadata.name for o in objs] == ['config-a', 'config-b']
+
     def test_no_file(self, manifest_dir):
         """Load manifest file which does not exist."""
 
@@ -401,3 +503,24 @@ class TestLoadFile:
 
         with pytest.raises(yaml.YAMLError):
             manifest.load_file(os.path.join(manifest_dir, 'invalid.yaml'))
+
+
+class TestIterLoadFile:
+    """Tests for kubetest.manifest.iter_load_file."""
+
+    def test_ok_multi(self, manifest_dir):
+        """Iterate over a manifest file with multiple object definitions."""
+
+        path = os.path.join(manifest_dir, 'multi-obj-manifest.yaml')
+        objs = manifest.iter_load_file(path)
+
+        assert not isinstance(objs, list)
+        assert list(objs) == manifest.load_file(path)
+
+    def test_no_file(self, manifest_dir):
+        """Iterate over a manifest file which does not exist."""
+
+        with pytest.raises(FileNotFoundError):
+            list(manifest.iter_load_file(
+                os.path.join(manifest_dir, 'file-does-not-exist.yaml')
+            ))